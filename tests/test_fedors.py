@@ -56,3 +56,12 @@ def test_Fedors():
     Vc, status, _, _, _ = Fedors('O=[U](=O)=O')
     assert status != 'OK'
 
+    # More than rdkit's default of 1000 substructure matches are all counted
+    Vc, status, _, _, _ = Fedors('C' + 'C(O)C'*1100)
+    assert_close(Vc, 0.135991714)
+
+    # Editable molecules are used as they are rather than parsed as SMILES
+    from rdkit import Chem
+    Vc, status, _, _, _ = Fedors(Chem.RWMol(Chem.MolFromSmiles('CCC(C)O')))
+    assert_close(Vc, 0.000274024)
+
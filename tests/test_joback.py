@@ -40,7 +40,7 @@ except:
 @pytest.mark.skipif(rdkit is None, reason="requires rdkit")
 def test_Joback_acetone():
     from rdkit import Chem
-    for i in [Chem.MolFromSmiles('CC(=O)C'), 'CC(=O)C']:
+    for i in [Chem.MolFromSmiles('CC(=O)C'), Chem.RWMol(Chem.MolFromSmiles('CC(=O)C')), 'CC(=O)C']:
         ex = Joback(i) # Acetone example
         assert_close(ex.Tb(ex.counts), 322.11)
         assert_close(ex.Tm(ex.counts), 173.5)
@@ -67,6 +67,79 @@ def test_Joback_acetone():
     obj = Joback(nitrobenzene)
     res = obj.estimate()
     assert res['mul_coeffs'] is None
+    # Unknown groups and groups without a contribution give None
+    assert Joback.Tb({99: 1}) is None
+    assert Joback.Tc({1: 2, 36: 1}) is None
+    assert Joback.Cpig_coeffs({1: 2, 34: 1}) is None
+    # Too many groups for the Tc correlation, which would give a negative Tc
+    assert Joback.Tc({1: 100}) is None
+    # Groups and atoms which make the Pc correlation divide by zero
+    assert Joback.Pc({32: 13}, 11) is None
+    assert Joback.Pc({99: 1}, 11) is None
+
+
+@pytest.mark.rdkit
+@pytest.mark.skipif(rdkit is None, reason="requires rdkit")
+def test_Joback_parse_cache():
+    first = Joback('CC(=O)C')
+    first.counts[1] = 100
+    first.rdkitmol.SetProp('_Name', 'first')
+    # A repeated SMILES string is parsed once, but does not share the counts
+    # or the molecules
+    second = Joback('CC(=O)C')
+    assert second.counts == {1: 2, 24: 1}
+    assert not second.rdkitmol.HasProp('_Name')
+    assert second.rdkitmol is not first.rdkitmol
+    assert second.rdkitmol_Hs is not first.rdkitmol_Hs
+    assert Joback('CC(=O)C', atom_count=5, MW=1.0).MW == 1.0
+    assert_close(Joback('CC(=O)C', atom_count=5).MW, first.MW)
+
+    # Identical fragmentations share coefficients, but not the lists
+    coeffs = Joback('CC(=O)C').estimate()['Cpig_coeffs']
+    coeffs[0] = 1e10
+    assert_close(Joback('CC(C)=O').Cpig(300.0), 75.32642000000001)
+
+
+@pytest.mark.rdkit
+@pytest.mark.skipif(rdkit is None, reason="requires rdkit")
+def test_smarts_fragment_catalog_cache():
+    from thermo.group_contribution.group_contribution_base import smarts_fragment
+    catalog = dict(J_BIGGS_JOBACK_SMARTS_id_dict)
+    assert smarts_fragment(catalog, smi='CC(=O)C') == ({1: 2, 24: 1}, True, 'OK')
+    assert smarts_fragment(catalog, smi='CC(=O)C') == ({1: 2, 24: 1}, True, 'OK')
+
+    # Modifying the catalog in place must not reuse the old patterns
+    del catalog[24]
+    counts, success, status = smarts_fragment(catalog, smi='CC(=O)C')
+    assert 24 not in counts
+    assert not success
+
+    # Only a bounded number of catalogs have their patterns kept
+    from thermo.group_contribution import group_contribution_base
+    catalogs = [dict(J_BIGGS_JOBACK_SMARTS_id_dict) for _ in range(group_contribution_base.compiled_smarts_catalogs_size + 5)]
+    for catalog in catalogs:
+        smarts_fragment(catalog, smi='CC(=O)C', cache=False)
+    assert len(group_contribution_base.compiled_smarts_catalogs) == group_contribution_base.compiled_smarts_catalogs_size
+
+
+@pytest.mark.rdkit
+@pytest.mark.skipif(rdkit is None, reason="requires rdkit")
+def test_smarts_fragment_result_cache():
+    from rdkit import Chem
+
+    from thermo.group_contribution.group_contribution_base import smarts_fragment
+    mol = Chem.MolFromSmiles('CC(=O)C')
+    counts, success, status = smarts_fragment(J_BIGGS_JOBACK_SMARTS_id_dict, rdkitmol=mol)
+    assert counts == {1: 2, 24: 1}
+    # Modifying a returned result must not change what is returned later
+    counts[1] = 100
+    for kwargs in ({'smi': 'CC(=O)C'}, {'smi': 'CC(=O)C'}, {'rdkitmol': mol},
+                   {'smi': 'CC(=O)C', 'cache': False}):
+        counts, success, status = smarts_fragment(J_BIGGS_JOBACK_SMARTS_id_dict, **kwargs)
+        assert (counts, success, status) == ({1: 2, 24: 1}, True, 'OK')
+        counts[1] = 100
+    # The caller's molecule is left untouched
+    assert not mol.HasProp('_smilesAtomOutputOrder')
 
 
 @pytest.mark.fuzz
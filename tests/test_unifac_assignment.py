@@ -1013,3 +1013,49 @@ def test_DOUFSG_group_detection():
     assignment, _, _, success, status = smarts_fragment_priority(catalog=DOUFSG_GROUPS, rdkitmol=rdkitmol)
     assert assignment == {100: 1, 1:2}
     assert success
+
+
+def test_prioritized_catalog_changes():
+    from types import SimpleNamespace
+
+    from thermo.group_contribution import group_contribution_base
+    from thermo.group_contribution.group_contribution_base import prioritized_catalog
+    catalog = [SimpleNamespace(group_id=1, priority=1), SimpleNamespace(group_id=2, priority=2),
+               SimpleNamespace(group_id=3, priority=None)]
+    used, by_priority = prioritized_catalog(catalog)
+    assert [i.group_id for i in used] == [1, 2]
+    assert [i.group_id for i in by_priority] == [2, 1]
+
+    # A priority changed in place is seen
+    catalog[0].priority = 3
+    assert [i.group_id for i in prioritized_catalog(catalog)[1]] == [1, 2]
+    catalog[2].priority = 0
+    assert [i.group_id for i in prioritized_catalog(catalog)[1]] == [1, 2, 3]
+
+    # Only a bounded number of catalogs are kept
+    catalogs = [list(catalog) for _ in range(group_contribution_base.prioritized_catalogs_size + 5)]
+    for c in catalogs:
+        prioritized_catalog(c)
+    assert len(group_contribution_base.prioritized_catalogs) == group_contribution_base.prioritized_catalogs_size
+
+
+@pytest.mark.rdkit
+@pytest.mark.skipif(rdkit is None, reason="requires rdkit")
+def test_smarts_fragment_priority_catalog_types():
+    # Any iterable of groups works as a catalog, cached or not
+    for catalog in (list(UFSG.values()), tuple(UFSG.values()), UFSG.values()):
+        for cache in (True, True, False):
+            assignment, _, _, success, status = smarts_fragment_priority(catalog=catalog, smi='CCO', cache=cache)
+            assert assignment == {14: 1, 1: 1, 2: 1}
+            assert success
+
+    # A priority changed in place is not answered from the cache
+    catalog = list(UFSG.values())
+    priority = UFSG[14].priority
+    try:
+        UFSG[14].priority = None
+        assignment, _, _, success, status = smarts_fragment_priority(catalog=catalog, smi='CCO')
+        assert 14 not in assignment
+    finally:
+        UFSG[14].priority = priority
+    assert smarts_fragment_priority(catalog=catalog, smi='CCO')[0] == {14: 1, 1: 1, 2: 1}
@@ -42,6 +42,7 @@ from thermo.vapor_pressure import (
     COOLPROP,
     DIPPR_PERRY_8E,
     EDALAT,
+    EOS,
     LEE_KESLER_PSAT,
     SANJARI,
     VDI_PPDS,
@@ -504,6 +505,47 @@ def test_VaporPressure_analytical_derivatives():
     assert_close(cycloheptane.calculate_derivative(T=400.0, method=ANTOINE_POLING, order=2), 65.83298769903531, rtol=1e-13)
 
 
+def test_VaporPressure_calculate_vectorized():
+    Psat = VaporPressure(CASRN="108-38-3", Tb=412.25, Tc=617.0, Pc=3541000.0, omega=0.331)
+    # Includes points above Tc and where T + C is negative for the Antoine methods
+    Ts = [1.0, 250.0, 300.0, 400.0, 617.0, 700.0]
+    for method in [WAGNER_MCGARRY, WAGNER_POLING, VDI_PPDS, ANTOINE_POLING, ANTOINE_WEBBOOK,
+                   LANDOLT, DIPPR_PERRY_8E, LEE_KESLER_PSAT]:
+        if method == LEE_KESLER_PSAT:
+            # Evaluated point by point
+            Ts = Ts[1:-1]
+        expect = [Psat.calculate(T, method) for T in Ts]
+        assert_close1d(Psat.calculate_vectorized(Ts, method), expect, rtol=1e-13)
+        assert_close1d(Psat.calculate_vectorized(np.array(Ts), method), expect, rtol=1e-13)
+
+    # Scalars and 0-d arrays are a single temperature, for either path
+    for method in (LANDOLT, LEE_KESLER_PSAT):
+        for T in (300.0, np.array(300.0)):
+            assert_close1d(Psat.calculate_vectorized(T, method), [Psat.calculate(300.0, method)], rtol=1e-13)
+
+    # A large but finite T**E is used as is, and only an overflowing one is
+    # replaced, as in EQ101
+    A, B, C, D, E = Psat.Perrys2_8_coeffs
+    Psat.Perrys2_8_coeffs = [A, B, C, -1e-268, 90.0]
+    Ts = [300.0, 1000.0, 1e4]
+    expect = [Psat.calculate(T, DIPPR_PERRY_8E) for T in Ts]
+    assert_close1d(Psat.calculate_vectorized(Ts, DIPPR_PERRY_8E), expect, rtol=1e-13)
+
+
+def test_VaporPressure_EOS_errors():
+    from fluids.numerics import NoSolutionError
+    class FailingEOS:
+        def __init__(self, msg):
+            self.msg = msg
+        def Psat(self, T):
+            raise NoSolutionError(self.msg)
+
+    Psat = VaporPressure(Tc=617.0, Pc=3541000.0, omega=0.331, eos=[FailingEOS('T is too low for equations')])
+    assert Psat.calculate(100.0, EOS) == 0.0
+    Psat = VaporPressure(Tc=617.0, Pc=3541000.0, omega=0.331, eos=[FailingEOS('Failed to converge')])
+    with pytest.raises(NoSolutionError):
+        Psat.calculate(100.0, EOS)
+
 
 def test_VaporPressure_no_isnan():
     assert not isnan(VaporPressure(CASRN='4390-04-9').Tmin)
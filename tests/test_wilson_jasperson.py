@@ -61,6 +61,14 @@ def test_Wilson_Jasperson():
     assert missing_Tc_increments
     assert missing_Pc_increments
 
+    # More than rdkit's default of 1000 substructure matches are all counted
+    Tc, Pc, _, _ = Wilson_Jasperson('C' + 'C(O)C'*1100, Tb=900.0)
+    assert_close(Tc, 391.13525628199096)
+
+    from rdkit import Chem
+    Tc, Pc, _, _ = Wilson_Jasperson(Chem.RWMol(Chem.MolFromSmiles('CCC1=CC=CC=C1O')), Tb=477.67)
+    assert_close(Tc, 693.5671723593391)
+
 
     # Can't make it match no matter what I do, but nothing looks like an issue
     # c = Chemical('acetic acid')
@@ -69,6 +77,38 @@ def test_Wilson_Jasperson():
     # c = Chemical('2-nonanone')
     # Wilson_Jasperson_first_order(c.rdkitmol, Tb=467.7),651.8
 
+
+@pytest.mark.rdkit
+@pytest.mark.skipif(rdkit is None, reason="requires rdkit")
+def test_Wilson_Jasperson_parse_cache():
+    from rdkit import Chem
+
+    from thermo.group_contribution.wilson_jasperson import wilson_jasperson_parse_cache
+    smi = 'CCC1=CC=CC=C1O'
+    first = Wilson_Jasperson(smi, Tb=477.67)
+    assert smi in wilson_jasperson_parse_cache
+    # A repeated SMILES string reuses its groups, at any boiling point
+    assert Wilson_Jasperson(smi, Tb=477.67) == first
+    assert Wilson_Jasperson(smi, Tb=500.0) == Wilson_Jasperson(Chem.MolFromSmiles(smi), Tb=500.0)
+    assert Wilson_Jasperson(smi, Tb=500.0, second_order=False) == Wilson_Jasperson(Chem.MolFromSmiles(smi), Tb=500.0, second_order=False)
+
+
+@pytest.mark.rdkit
+@pytest.mark.skipif(rdkit is None, reason="requires rdkit")
+def test_wilson_jasperson_fragment():
+    from rdkit import Chem
+
+    from thermo.group_contribution.wilson_jasperson import load_rdkit_modules, wilson_jasperson_fragment
+    load_rdkit_modules()
+    # One mercaptan, one sulfide, and one disulfide
+    Nr, atoms, groups = wilson_jasperson_fragment(Chem.MolFromSmiles('CSSC(S)CSC'))
+    assert groups['sulfur_groups'] == 3
+    # Primary and tertiary amines
+    Nr, atoms, groups = wilson_jasperson_fragment(Chem.MolFromSmiles('CN(C)CCN'))
+    assert groups['amine'] == 2
+    assert wilson_jasperson_fragment(Chem.MolFromSmiles('CN(C)CCN'), second_order=False) == (0, atoms, None)
+
+
 @pytest.mark.rdkit
 @pytest.mark.skipif(rdkit is None, reason="requires rdkit")
 def test_Wilson_Jasperson_paper():
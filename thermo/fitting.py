@@ -242,15 +242,15 @@ def fit_polynomial(func, low, high, n,
                 if arg < low_orig:
                     arg = low_orig
                 return func(arg)
-    func_fun = np.vectorize(func_fun)
+    func_fun_vec = np.vectorize(func_fun)
     if n == 1:
-        coeffs = [func_fun(0.5*(low + high)).tolist()]
+        coeffs = [func_fun_vec(0.5*(low + high)).tolist()]
         return coeffs
     else:
         if method in (FIT_CHEBTOOLS_CHEB, FIT_CHEBTOOLS_POLY, FIT_CHEBTOOLS_STABLEPOLY):
             if ChebTools is None:
                 import ChebTools
-            cheb_fun = ChebTools.generate_Chebyshev_expansion(n-1, func_fun, low, high)
+            cheb_fun = ChebTools.generate_Chebyshev_expansion(n-1, func_fun_vec, low, high)
             cheb_coeffs = cheb_fun.coef()
 
             if method in (FIT_CHEBTOOLS_STABLEPOLY, FIT_CHEBTOOLS_POLY):
@@ -268,6 +268,7 @@ def fit_polynomial(func, low, high, n,
                 y = [interpolation_property(v) for v in data[1]] if interpolation_property is not None else data[1]
             else:
                 x = linspace(low, high, 200)
+                # Evaluated point by point; np.vectorize costs more than the function here
                 y = [func_fun(xi) for xi in x]
             fit = Polynomial.fit(x, y, n)
             coeffs = fit.coef
@@ -303,7 +303,7 @@ mol_smarts_cache = {}
 def smarts_mol_cache(smarts):
     try:
         return mol_smarts_cache[smarts]
-    except:
+    except KeyError:
         pass
     if not loaded_rdkit:
         load_rdkit_modules()
@@ -2753,13 +2753,18 @@ def count_ring_ring_attatchments(mol):
     ri =  mol.GetRingInfo()
     atom_rings = ri.AtomRings()
     ring_count = len(atom_rings)
-    ring_ids = [frozenset(t) for t in atom_rings]
+    ring_masks = []
+    for ring in atom_rings:
+        mask = 0
+        for atom in ring:
+            mask |= 1 << atom
+        ring_masks.append(mask)
     ring_ring_attatchments = 0
     for i in range(ring_count):
+        mask = ring_masks[i]
         for j in range(i+1, ring_count):
-#             print(ring_ids[i].intersection(ring_ids[j]))
-            shared_atoms = int(len(ring_ids[i].intersection(ring_ids[j])) > 0)
-            ring_ring_attatchments += shared_atoms
+            if mask & ring_masks[j]:
+                ring_ring_attatchments += 1
     return ring_ring_attatchments
 
 
@@ -2793,35 +2798,35 @@ def count_rings_attatched_to_rings(mol, allow_neighbors=True, atom_rings=None):
         ring_info = mol.GetRingInfo()
         atom_rings = ring_info.AtomRings()
     ring_count = len(atom_rings)
-    ring_ids = [frozenset(t) for t in atom_rings]
+    # Each ring is an int bitmask of its atom indexes, so finding shared
+    # atoms is a single AND instead of a set intersection
+    ring_masks = []
+    for ring in atom_rings:
+        mask = 0
+        for atom in ring:
+            mask |= 1 << atom
+        ring_masks.append(mask)
+
+    # Atoms of every other ring, from the OR of the rings before and after
+    other_ring_masks = [0]*ring_count
+    mask = 0
+    for i in range(ring_count):
+        other_ring_masks[i] = mask
+        mask |= ring_masks[i]
+    mask = 0
+    for i in range(ring_count-1, -1, -1):
+        other_ring_masks[i] |= mask
+        mask |= ring_masks[i]
+
     rings_attatched_to_rings = 0
-    other_ring_atoms = set()
     for i in range(ring_count):
-        other_ring_atoms.clear()
-        attatched_to_ring = False
-        for j in range(ring_count):
-            if i != j:
-                other_ring_atoms.update(atom_rings[j])
-
-
-        for atom in atom_rings[i]:
-            if attatched_to_ring:
-                break
-
-            if atom in other_ring_atoms:
-                attatched_to_ring = True
-                break
-            if allow_neighbors:
-                atom_obj = mol.GetAtomWithIdx(atom)
-                neighbors = atom_obj.GetNeighbors()
-                for n in neighbors:
-                    if n.GetIdx() in other_ring_atoms:
-                        attatched_to_ring = True
-                        break
-                if attatched_to_ring:
-                    break
-        if attatched_to_ring:
-            rings_attatched_to_rings+= 1
+        reach = ring_masks[i]
+        if allow_neighbors and not reach & other_ring_masks[i]:
+            for atom in atom_rings[i]:
+                for n in mol.GetAtomWithIdx(atom).GetNeighbors():
+                    reach |= 1 << n.GetIdx()
+        if reach & other_ring_masks[i]:
+            rings_attatched_to_rings += 1
     return rings_attatched_to_rings
 
 benzene_smarts = 'c1ccccc1'
@@ -43,6 +43,32 @@ fedors_contributions = {'C': 34.426, 'H': 9.172, 'O': 20.291,
                        'double_bond': 5.028, 'triple_bond': 0.7973,
                        'ring_ring_bonds': 35.524}
 
+double_bond_smarts = '*=*'
+triple_bond_smarts = '*#*'
+# Any bond which is not single, double, triple, or aromatic
+unrecognized_bond_smarts = '*!-;!=;!#;!:*'
+
+rdkit_missing = 'RDKit is not installed; it is required to use this functionality'
+
+loaded_rdkit = False
+Chem = None
+alcohol_patt = amine_patt = double_bond_patt = triple_bond_patt = unrecognized_bond_patt = None
+def load_rdkit_modules():
+    global loaded_rdkit, Chem, alcohol_patt, amine_patt, double_bond_patt, triple_bond_patt, unrecognized_bond_patt
+    if loaded_rdkit:
+        return
+    try:
+        from rdkit import Chem
+        loaded_rdkit = True
+    except:
+        raise Exception(rdkit_missing) # pragma: no cover
+    # The patterns never change; look them up once per process
+    alcohol_patt = smarts_mol_cache(alcohol_smarts)
+    amine_patt = smarts_mol_cache(amine_smarts)
+    double_bond_patt = smarts_mol_cache(double_bond_smarts)
+    triple_bond_patt = smarts_mol_cache(triple_bond_smarts)
+    unrecognized_bond_patt = smarts_mol_cache(unrecognized_bond_smarts)
+
 
 def Fedors(mol):
     r'''Estimate the critical volume of a molecule
@@ -93,59 +119,44 @@ def Fedors(mol):
     .. [2] Green, Don, and Robert Perry. Perry's Chemical Engineers' Handbook,
        Eighth Edition. McGraw-Hill Professional, 2007.
     '''
-    from rdkit import Chem
-    if type(mol) is Chem.rdchem.Mol:
-        rdkitmol = Chem.Mol(mol)
+    if not loaded_rdkit:
+        load_rdkit_modules()
+    if isinstance(mol, Chem.rdchem.Mol):
         no_H_mol = mol
     else:
-        rdkitmol = Chem.MolFromSmiles(mol)
-        no_H_mol = Chem.Mol(rdkitmol)
+        no_H_mol = Chem.MolFromSmiles(mol)
 
-    # Canont modify the molecule we are given
-    rdkitmol = Chem.AddHs(rdkitmol)
+    # AddHs returns a new molecule, so the one we are given is not modified
+    # and does not need to be copied first
+    rdkitmol = Chem.AddHs(no_H_mol)
 
     ri = no_H_mol.GetRingInfo()
     atom_rings = ri.AtomRings()
 
-    UNRECOGNIZED_RING_SIZE = False
-    three_rings = four_rings = five_rings = six_rings = 0
-    for ring in atom_rings:
-        ring_size = len(ring)
-        if ring_size == 3:
-            three_rings += 1
-        elif ring_size == 4:
-            four_rings += 1
-        elif ring_size == 5:
-            five_rings += 1
-        elif ring_size == 6:
-            six_rings += 1
-        else:
-            UNRECOGNIZED_RING_SIZE = True
+    ring_sizes = [len(ring) for ring in atom_rings]
+    three_rings = ring_sizes.count(3)
+    four_rings = ring_sizes.count(4)
+    five_rings = ring_sizes.count(5)
+    six_rings = ring_sizes.count(6)
+    UNRECOGNIZED_RING_SIZE = three_rings + four_rings + five_rings + six_rings != len(ring_sizes)
 
     rings_attatched_to_rings = count_rings_attatched_to_rings(no_H_mol, atom_rings=atom_rings)
 
-    UNRECOGNIZED_BOND_TYPE = False
-    DOUBLE_BOND = Chem.rdchem.BondType.DOUBLE
-    TRIPLE_BOND = Chem.rdchem.BondType.TRIPLE
-    SINGLE_BOND = Chem.rdchem.BondType.SINGLE
-    AROMATIC_BOND = Chem.rdchem.BondType.AROMATIC
-
+    # GetBonds is very slow; counting the matches of a bond pattern keeps
+    # the iteration over the bonds inside rdkit
     double_bond_count = triple_bond_count = 0
-    # GetBonds is very slow; we can make it a little faster by iterating
-    # over a copy without hydrogens
-    for bond in no_H_mol.GetBonds():
-        bond_type = bond.GetBondType()
-        if bond_type is DOUBLE_BOND:
-            double_bond_count += 1
-        elif bond_type is TRIPLE_BOND:
-            triple_bond_count += 1
-        elif bond_type is SINGLE_BOND or bond_type is AROMATIC_BOND:
-            pass
-        else:
-            UNRECOGNIZED_BOND_TYPE = True
-
-    alcohol_matches = rdkitmol.GetSubstructMatches(smarts_mol_cache(alcohol_smarts))
-    amine_matches = rdkitmol.GetSubstructMatches(smarts_mol_cache(amine_smarts))
+    UNRECOGNIZED_BOND_TYPE = False
+    bond_count = no_H_mol.GetNumBonds()
+    if bond_count:
+        double_bond_count = len(no_H_mol.GetSubstructMatches(double_bond_patt, maxMatches=bond_count))
+        triple_bond_count = len(no_H_mol.GetSubstructMatches(triple_bond_patt, maxMatches=bond_count))
+        UNRECOGNIZED_BOND_TYPE = no_H_mol.HasSubstructMatch(unrecognized_bond_patt)
+
+    # Each match has its own atom, so rdkit's default cap of 1000 matches
+    # could undercount a large molecule but this one cannot
+    max_matches = rdkitmol.GetNumAtoms()
+    alcohol_matches = rdkitmol.GetSubstructMatches(alcohol_patt, maxMatches=max_matches)
+    amine_matches = rdkitmol.GetSubstructMatches(amine_patt, maxMatches=max_matches)
 
     # This was the fastest way to get the atom counts
     atoms = simple_formula_parser(Chem.rdMolDescriptors.CalcMolFormula(rdkitmol))
@@ -172,10 +183,8 @@ def Fedors(mol):
 #     print(atoms)
     Vc = 26.6
     for k, v in fedors_contributions.items():
-        try:
+        if k in atoms:
             Vc += atoms[k]*v
-        except KeyError:
-            pass
 
     Vc *= 1e-6
 
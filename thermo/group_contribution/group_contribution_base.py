@@ -20,7 +20,8 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 
 '''
-from chemicals.elements import simple_formula_parser
+from collections import Counter, OrderedDict, defaultdict
+from itertools import combinations
 
 __all__ = ['str_group_assignment_to_dict', 'group_assignment_to_str',
            'smarts_fragment_priority', 'smarts_fragment']
@@ -112,7 +113,74 @@ def str_group_assignment_to_dict(counts, pair_separator=',', key_val_separator='
 
 
 
-def smarts_fragment_priority(catalog, rdkitmol=None, smi=None):
+fragment_cache = OrderedDict()
+fragment_cache_size = 4096
+
+def fragment_cache_get(key, prepared_catalog):
+    # `prepared_catalog` is what `prioritized_catalog` or
+    # `compile_smarts_catalog` returned for the catalog; they only return the
+    # same object while the catalog is unchanged, and each entry holds on to
+    # it, so comparing identities is enough
+    try:
+        cached_prepared_catalog, result = fragment_cache[key]
+    except KeyError:
+        return None
+    if cached_prepared_catalog is not prepared_catalog:
+        return None
+    fragment_cache.move_to_end(key)
+    return result
+
+def fragment_cache_set(key, prepared_catalog, result):
+    fragment_cache[key] = (prepared_catalog, result)
+    if len(fragment_cache) > fragment_cache_size:
+        fragment_cache.popitem(last=False)
+
+def fragment_result_copy(result):
+    # Callers get their own containers so they cannot modify a cached result
+    copied = []
+    for v in result:
+        if isinstance(v, dict):
+            v = {k: (list(i) if isinstance(i, list) else i) for k, i in v.items()}
+        elif isinstance(v, set):
+            v = set(v)
+        copied.append(v)
+    return tuple(copied)
+
+prioritized_catalogs = OrderedDict()
+prioritized_catalogs_size = 32
+
+def prioritized_catalog(catalog):
+    # The objects of a `smarts_fragment_priority` catalog which have a
+    # priority, in catalog order and in the order they are assigned in. The
+    # sort is kept for as long as the same catalog holds the same objects
+    # with the same priorities; only the most recently used catalogs are kept.
+    # Any iterable of objects is accepted as a catalog.
+    catalog_key = id(catalog)
+    catalog = list(catalog)
+    catalog_priorities = [i.priority for i in catalog]
+    try:
+        cached_catalog, cached_priorities, result = prioritized_catalogs[catalog_key]
+        if (cached_priorities == catalog_priorities and len(cached_catalog) == len(catalog)
+                and all(a is b for a, b in zip(cached_catalog, catalog))):
+            prioritized_catalogs.move_to_end(catalog_key)
+            return result
+    except KeyError:
+        pass
+    used = [i for i in catalog if i.priority is not None]
+
+    # Higher should be lower
+    priorities = [i.priority for i in used]
+    groups = [i.group_id for i in used]
+    group_to_obj = {o.group_id: o for o in used}
+    catalog_by_priority =  [group_to_obj[g] for _, g in sorted(zip(priorities, groups), reverse=True)]
+    result = (used, catalog_by_priority)
+    prioritized_catalogs[catalog_key] = (catalog, catalog_priorities, result)
+    prioritized_catalogs.move_to_end(catalog_key)
+    if len(prioritized_catalogs) > prioritized_catalogs_size:
+        prioritized_catalogs.popitem(last=False)
+    return result
+
+def smarts_fragment_priority(catalog, rdkitmol=None, smi=None, cache=True):
     r'''Fragments a molecule into a set of unique groups and counts as
     specified by the `catalog`, which is a list of objects containing
     the attributes `smarts`, `group`, and `priority`.
@@ -130,6 +198,10 @@ def smarts_fragment_priority(catalog, rdkitmol=None, smi=None):
         Molecule as rdkit object, [-]
     smi : str, optional
         Smiles string representing a chemical, [-]
+    cache : bool, optional
+        Whether or not to reuse the result of a previous fragmentation of the
+        same `smi` with the same catalog; molecules given as `rdkitmol` are
+        never cached, [-]
 
     Returns
     -------
@@ -151,6 +223,10 @@ def smarts_fragment_priority(catalog, rdkitmol=None, smi=None):
     Raises an exception if rdkit is not installed, or `smi` or `rdkitmol` is
     not defined.
 
+    Cached results are only reused if the catalog holds the same objects
+    with the same priorities; if the patterns of the objects in the catalog
+    are modified, use `cache=False`.
+
     Examples
     --------
     '''
@@ -158,29 +234,39 @@ def smarts_fragment_priority(catalog, rdkitmol=None, smi=None):
         load_rdkit_modules()
     if rdkitmol is None and smi is None:
         raise Exception('Either an rdkit mol or a smiles string is required')
+    # Only smiles inputs are cached; identifying a molecule would cost about
+    # as much as fragmenting it
+    if cache and smi is not None:
+        prepared_catalog = prioritized_catalog(catalog)
+        key = ('priority', id(catalog), smi)
+        result = fragment_cache_get(key, prepared_catalog)
+        if result is None:
+            result = smarts_fragment_priority(catalog, rdkitmol=rdkitmol, smi=smi, cache=False)
+            fragment_cache_set(key, prepared_catalog, result)
+        return fragment_result_copy(result)
     if smi is not None:
         rdkitmol = Chem.MolFromSmiles(smi)
         if rdkitmol is None:
             status = 'Failed to construct mol'
             success = False
             return {}, success, status
-    from itertools import combinations
 
-    # Remove this
-    catalog = [i for i in catalog if i.priority is not None]
+    catalog, catalog_by_priority = prioritized_catalog(catalog)
 
-    rdkitmol_Hs = Chem.AddHs(rdkitmol)
-    # H_count = rdkitmol_Hs.GetNumAtoms() - rdkitmol.GetNumAtoms()
-    atoms = simple_formula_parser(rdMolDescriptors.CalcMolFormula(rdkitmol))
-    H_count = atoms.get('H', 0)
-
-    H_counts_by_idx = {}
+    # Count the hydrogens from the atoms rather than adding them to the
+    # molecule; an explicit hydrogen bonded to nothing is counted by itself
+    H_count = 0
+    H_counts_by_idx = []
     for at in rdkitmol.GetAtoms():
-        H_counts_by_idx[at.GetIdx()] = at.GetTotalNumHs(includeNeighbors=True)
+        H_counts_by_idx.append(at.GetTotalNumHs(includeNeighbors=True))
+        H_count += H_counts_by_idx[-1]
+        if at.GetAtomicNum() == 1 and not at.GetDegree():
+            H_count += 1
 
 
-    all_atom_idxs = {i.GetIdx() for i in rdkitmol.GetAtoms()}
-    atom_count = len(all_atom_idxs)
+    atom_count = rdkitmol.GetNumAtoms()
+    # Sets of atoms are handled as integers with bit `i` set for atom `i`
+    all_atoms_mask = (1 << atom_count) - 1
     status = 'OK'
     success = True
 
@@ -200,54 +286,66 @@ def smarts_fragment_priority(catalog, rdkitmol=None, smi=None):
         if isinstance(patt, (list, tuple)):
             hits = set()
             for p in patt:
-                hits.update(list(rdkitmol.GetSubstructMatches(p)))
+                if p.GetNumAtoms() <= atom_count:
+                    hits.update(rdkitmol.GetSubstructMatches(p))
             hits = list(hits)
+        elif patt.GetNumAtoms() > atom_count:
+            # A pattern larger than the molecule cannot match it
+            continue
         else:
-            hits = list(rdkitmol.GetSubstructMatches(patt))
+            hits = rdkitmol.GetSubstructMatches(patt)
         if hits:
             all_matches[key] = hits
             counts[key] = len(hits)
 
-    # Higher should be lower
-    priorities = [i.priority for i in catalog]
-    groups = [i.group_id for i in catalog]
-    group_to_obj = {o.group_id: o for o in catalog}
-    catalog_by_priority =  [group_to_obj[g] for _, g in sorted(zip(priorities, groups), reverse=True)]
-
-    all_heavies_matched_by_a_pattern = set()
-    for v in all_matches.values():
-        for t in v:
-            all_heavies_matched_by_a_pattern.update(t)
-
-    # excludes H
-
-    ignore_matches = set()
-    matched_atoms, final_group_counts, final_assignments = run_match(catalog_by_priority, all_matches, ignore_matches, all_atom_idxs, H_count)
+    # Lay out the candidate matches flat, in the order run_match tries them:
+    # their group, atoms, atom bitmask, and the hydrogens they account for
+    candidate_groups, candidate_matches, candidate_masks, candidate_Hs = [], [], [], []
+    candidate_idxs = {}
+    # Candidates which can never be accepted, as a bitmask of their positions
+    unusable = 0
+    # Every atom matched by a pattern; excludes H
+    all_heavies_matched_by_a_pattern = 0
+    for obj in catalog_by_priority:
+        group_id = obj.group_id
+        if group_id not in all_matches:
+            continue
+        group_H = None if obj.hydrogen_from_smarts else obj.atoms.get('H', 0)
+        for match in all_matches[group_id]:
+            mask = atom_mask(match)
+            all_heavies_matched_by_a_pattern |= mask
+            k = len(candidate_masks)
+            # If the group matches everything, check the group has the right number of hydrogens
+            if mask == all_atoms_mask and H_count and obj.atoms.get('H', 0) != H_count:
+                unusable |= 1 << k
+            candidate_idxs[(group_id, match)] = k
+            candidate_groups.append(group_id)
+            candidate_matches.append(match)
+            candidate_masks.append(mask)
+            candidate_Hs.append(sum(H_counts_by_idx[i] for i in match) if group_H is None else group_H)
+
+    matched_mask, accepted = run_match(candidate_masks, unusable)
     # Count the hydrogens
 
-    heavy_atom_matched = atom_count == len(matched_atoms)
-    hydrogens_found = 0
-    for found_group in final_assignments.keys():
-        for found_atoms in final_assignments[found_group]:
-            if group_to_obj[found_group].hydrogen_from_smarts:
-                hydrogens_found += sum(H_counts_by_idx[i] for i in found_atoms)
-            else:
-                hydrogens_found += group_to_obj[found_group].atoms.get('H', 0)
+    heavy_atom_matched = matched_mask == all_atoms_mask
+    hydrogens_found = accepted_sum(candidate_Hs, accepted)
 
     #hydrogens_found = sum(group_to_obj[g].atoms.get('H', 0)*v for g, v in final_group_counts.items())
     hydrogens_matched = hydrogens_found == H_count
 
-    if len(all_heavies_matched_by_a_pattern) != atom_count:
+    if all_heavies_matched_by_a_pattern != all_atoms_mask:
         status = 'Did not match all atoms present'
         success = False
-        return final_group_counts, final_assignments, matched_atoms, success, status
+        final_group_counts, final_assignments = accepted_assignments(candidate_groups, candidate_matches, accepted)
+        return final_group_counts, final_assignments, mask_atoms(matched_mask), success, status
 
     success = heavy_atom_matched and hydrogens_matched
     if not success:
+        # Candidates as bits, in the order of the groups of the catalog
         things_to_ignore = []
         for k in all_matches:
             for v in all_matches[k]:
-                things_to_ignore.append((k, v))
+                things_to_ignore.append(1 << candidate_idxs[(k, v)])
 
         # if len(things_to_ignore) < 25:
             # remove_up_to = 4
@@ -261,28 +359,40 @@ def smarts_fragment_priority(catalog, rdkitmol=None, smi=None):
         max_tries = 20000
         tries = 0
 
+        # run_match is greedy and deterministic, so ignoring a match which
+        # was not accepted anyway cannot change its result. Any combination
+        # containing such a match repeats a run one size smaller which has
+        # already failed, and does not need to be run again.
+        previous_runs = {0: (matched_mask, accepted)}
         done = False
         for remove in range(1, remove_up_to+1):
             if done:
                 break
+            current_runs = {}
             for ignore_matches in combinations(things_to_ignore, remove):
                 tries += 1
                 if tries > max_tries:
                     break
 
-                ignore_matches = set(ignore_matches)
-                matched_atoms, final_group_counts, final_assignments = run_match(catalog_by_priority, all_matches, ignore_matches, all_atom_idxs, H_count)
-                heavy_atom_matched = atom_count == len(matched_atoms)
+                ignore_mask = sum(ignore_matches)
+                repeated_run = None
+                for ignored in ignore_matches:
+                    smaller_run = previous_runs.get(ignore_mask ^ ignored)
+                    if smaller_run is not None and not smaller_run[1] & ignored:
+                        repeated_run = smaller_run
+                        break
+                if repeated_run is not None:
+                    current_runs[ignore_mask] = repeated_run
+                    matched_mask, accepted = repeated_run
+                    continue
+
+                matched_mask, accepted = run_match(candidate_masks, unusable | ignore_mask)
+                current_runs[ignore_mask] = (matched_mask, accepted)
+                heavy_atom_matched = matched_mask == all_atoms_mask
                 if not heavy_atom_matched:
                     continue
 
-                hydrogens_found = 0
-                for found_group in final_assignments.keys():
-                    for found_atoms in final_assignments[found_group]:
-                        if group_to_obj[found_group].hydrogen_from_smarts:
-                            hydrogens_found += sum(H_counts_by_idx[i] for i in found_atoms)
-                        else:
-                            hydrogens_found += group_to_obj[found_group].atoms.get('H', 0)
+                hydrogens_found = accepted_sum(candidate_Hs, accepted)
 
                 hydrogens_matched = hydrogens_found == H_count
                 success = heavy_atom_matched and hydrogens_matched
@@ -290,48 +400,111 @@ def smarts_fragment_priority(catalog, rdkitmol=None, smi=None):
                 if success:
                     done = True
                     break
+            previous_runs = current_runs
 
     if not success:
         status = 'Did not match all atoms present'
 
-    return final_group_counts, final_assignments, matched_atoms, success, status
-
-def run_match(catalog_by_priority, all_matches, ignore_matches, all_atom_idxs,
-              H_count):
-    matched_atoms = set()
-    final_group_counts = {}
-    final_assignments = {}
-    for obj in catalog_by_priority:
-        if obj.group_id in all_matches:
-            for match in all_matches[obj.group_id]:
-                match_set = set(match)
-                if match_set.intersection(matched_atoms):
-                    # At least one atom is already matched - keep looking
-                    continue
-
-                # If the group matches everything, check the group has the right number of hydrogens
-                if match_set == all_atom_idxs and H_count and obj.atoms.get('H', 0) != H_count:
-                    continue
-
-                if (obj.group_id, match) in ignore_matches:
-                    continue
-                matched_atoms.update(match)
-                try:
-                    final_group_counts[obj.group_id]
-                except:
-                    final_group_counts[obj.group_id] = 0
-                final_group_counts[obj.group_id] += 1
-
-                try:
-                    final_assignments[obj.group_id]
-                except:
-                    final_assignments[obj.group_id] = []
-                final_assignments[obj.group_id].append(match)
-    return matched_atoms, final_group_counts, final_assignments
-
-
-
-def smarts_fragment(catalog, rdkitmol=None, smi=None, deduplicate=True):
+    final_group_counts, final_assignments = accepted_assignments(candidate_groups, candidate_matches, accepted)
+    return final_group_counts, final_assignments, mask_atoms(matched_mask), success, status
+
+def run_match(candidate_masks, ignored):
+    # Greedily accept each candidate match, in order, which does not overlap
+    # an already accepted match and is not set in the bitmask `ignored`.
+    # Returns the mask of matched atoms and the bitmask of accepted candidates.
+    matched_mask = 0
+    accepted = 0
+    bit = 1
+    for mask in candidate_masks:
+        if not (matched_mask & mask or ignored & bit):
+            matched_mask |= mask
+            accepted |= bit
+        bit <<= 1
+    return matched_mask, accepted
+
+def accepted_sum(values, accepted):
+    tot = 0
+    k = 0
+    while accepted:
+        if accepted & 1:
+            tot += values[k]
+        accepted >>= 1
+        k += 1
+    return tot
+
+def accepted_assignments(candidate_groups, candidate_matches, accepted):
+    final_group_counts = defaultdict(int)
+    final_assignments = defaultdict(list)
+    k = 0
+    while accepted:
+        if accepted & 1:
+            group_id = candidate_groups[k]
+            final_group_counts[group_id] += 1
+            final_assignments[group_id].append(candidate_matches[k])
+        accepted >>= 1
+        k += 1
+    return dict(final_group_counts), dict(final_assignments)
+
+
+
+compiled_smarts_catalogs = OrderedDict()
+compiled_smarts_catalogs_size = 32
+
+def compile_smarts_catalog(catalog):
+    # Parse the SMARTS strings of a `smarts_fragment` catalog into a list of
+    # (pattern atom count, key, pattern), largest pattern first. The result is
+    # kept for as long as the same catalog object is used without changes;
+    # only the most recently used catalogs are kept.
+    try:
+        cached_catalog, cached_copy, patts = compiled_smarts_catalogs[id(catalog)]
+        if cached_catalog is catalog and cached_copy == catalog:
+            compiled_smarts_catalogs.move_to_end(id(catalog))
+            return patts
+    except KeyError:
+        pass
+    patts = []
+    for key, smart in catalog.items():
+        if isinstance(smart, str):
+            patt = Chem.MolFromSmarts(smart)
+        else:
+            patt = smart
+        patts.append((patt.GetNumAtoms(), key, patt))
+    patts.sort(key=lambda x: -x[0])
+    compiled_smarts_catalogs[id(catalog)] = (catalog, dict(catalog), patts)
+    compiled_smarts_catalogs.move_to_end(id(catalog))
+    if len(compiled_smarts_catalogs) > compiled_smarts_catalogs_size:
+        compiled_smarts_catalogs.popitem(last=False)
+    return patts
+
+def atom_mask(atoms):
+    # Integer with bit `i` set for every atom index `i` in `atoms`
+    mask = 0
+    for i in atoms:
+        mask |= 1 << i
+    return mask
+
+def mask_atoms(mask):
+    # Set of the atom indexes whose bits are set in `mask`
+    atoms = set()
+    i = 0
+    while mask:
+        if mask & 1:
+            atoms.add(i)
+        mask >>= 1
+        i += 1
+    return atoms
+
+def matched_masks(all_masks):
+    # Masks of the atoms matched at least once, and more than once
+    covered = duplicated = 0
+    for group_mask_list in all_masks.values():
+        for mask in group_mask_list:
+            duplicated |= covered & mask
+            covered |= mask
+    return covered, duplicated
+
+def smarts_fragment(catalog, rdkitmol=None, smi=None, deduplicate=True,
+                    cache=True):
     r'''Fragments a molecule into a set of unique groups and counts as
     specified by the `catalog`. The molecule can either be an rdkit
     molecule object, or a smiles string which will be parsed by rdkit.
@@ -346,6 +519,12 @@ def smarts_fragment(catalog, rdkitmol=None, smi=None, deduplicate=True):
         Molecule as rdkit object, [-]
     smi : str, optional
         Smiles string representing a chemical, [-]
+    deduplicate : bool, optional
+        Whether or not to remove the smaller of matches which share atoms, [-]
+    cache : bool, optional
+        Whether or not to reuse the result of a previous fragmentation of the
+        same `smi` with the same catalog; molecules given as `rdkitmol` are
+        never cached, [-]
 
     Returns
     -------
@@ -384,83 +563,99 @@ def smarts_fragment(catalog, rdkitmol=None, smi=None, deduplicate=True):
         load_rdkit_modules()
     if rdkitmol is None and smi is None:
         raise Exception('Either an rdkit mol or a smiles string is required')
+    # Only smiles inputs are cached; identifying a molecule would cost about
+    # as much as fragmenting it
+    if cache and smi is not None:
+        prepared_catalog = compile_smarts_catalog(catalog)
+        key = ('fragment', id(catalog), smi, deduplicate)
+        result = fragment_cache_get(key, prepared_catalog)
+        if result is None:
+            result = smarts_fragment(catalog, rdkitmol=rdkitmol, smi=smi, deduplicate=deduplicate, cache=False)
+            fragment_cache_set(key, prepared_catalog, result)
+        return fragment_result_copy(result)
     if smi is not None:
         rdkitmol = Chem.MolFromSmiles(smi)
         if rdkitmol is None:
             status = 'Failed to construct mol'
             success = False
             return {}, success, status
-    from collections import Counter
 
     atom_count = len(rdkitmol.GetAtoms())
     status = 'OK'
     success = True
 
+    # The patterns are sorted largest first; skip those too large to fit in
+    # the molecule, after which all the remaining ones fit as well
+    patts = compile_smarts_catalog(catalog)
+    start = 0
+    while start < len(patts) and patts[start][0] > atom_count:
+        start += 1
+    found = {}
+    for _, key, patt in patts[start:]:
+        hits = rdkitmol.GetSubstructMatches(patt)
+        if hits:
+            found[key] = hits
+
+    # Report the groups in the order of the catalog regardless of search order
     counts = {}
     all_matches = {}
-    for key, smart in catalog.items():
-        if isinstance(smart, str):
-            patt = Chem.MolFromSmarts(smart)
-        else:
-            patt = smart
-        hits = list(rdkitmol.GetSubstructMatches(patt))
-        if hits:
+    for key in catalog:
+        if key in found:
+            hits = found[key]
             all_matches[key] = hits
             counts[key] = len(hits)
 
-    # Duplicate group cleanup
-    matched_atoms = []
-    for i in all_matches.values():
-        for j in i:
-            matched_atoms.extend(j)
+    all_masks = {group: [atom_mask(match) for match in group_match_list]
+                 for group, group_match_list in all_matches.items()}
+    covered, duplicated = matched_masks(all_masks)
 
-    if deduplicate:
-        dups = [i for i, c in Counter(matched_atoms).items() if c > 1]
+    # Duplicate group cleanup, only needed if an atom was matched twice
+    if deduplicate and duplicated:
         iteration = 0
-        while (dups and iteration < 100):
-            dup = dups[0]
-
-            dup_smart_matches = []
+        while duplicated and iteration < 100:
+            # The matches sharing each duplicated atom, in order of matching
+            dup_smart_matches = {}
             for group, group_match_list in all_matches.items():
+                group_mask_list = all_masks[group]
                 for i, group_match_i in enumerate(group_match_list):
-                    if dup in group_match_i:
-                        dup_smart_matches.append((group, i, group_match_i, len(group_match_i)))
-
-
-            sizes = [i[3] for i in dup_smart_matches]
-            max_size = max(sizes)
-#            print(sizes, 'sizes', 'dup', dup, 'working_data', dup_smart_matches)
-            if sizes.count(max_size) > 1:
-                iteration += 1
-#                print('BAD')
-                # Two same size groups, continue, can't do anything
-                continue
-            else:
-                # Remove matches that are not the largest
-                for group, idx, positions, size in dup_smart_matches:
-                    if size != max_size:
-                        # Not handling the case of multiple duplicate matches right, indexes changing!!!
-                        del all_matches[group][idx]
-                        continue
-
-            matched_atoms = []
-            for i in all_matches.values():
-                for j in i:
-                    matched_atoms.extend(j)
-
-            dups = [i for i, c in Counter(matched_atoms).items() if c > 1]
+                    if group_mask_list[i] & duplicated:
+                        for dup in group_match_i:
+                            if duplicated >> dup & 1:
+                                dup_smart_matches.setdefault(dup, []).append((group, i))
+
+            # Keep only the largest match of each duplicated atom; resolve
+            # every atom which can be resolved in this pass at once
+            keep, remove = set(), set()
+            for dup, matches in dup_smart_matches.items():
+                sizes = [len(all_matches[group][i]) for group, i in matches]
+                max_size = max(sizes)
+                if sizes.count(max_size) > 1:
+                    # Two same size groups, can't do anything
+                    continue
+                largest = matches[sizes.index(max_size)]
+                smaller = [m for m, size in zip(matches, sizes) if size != max_size]
+                if largest in remove or keep.intersection(smaller):
+                    # Conflicts with an atom resolved earlier in this pass;
+                    # look at it again once those matches are removed
+                    continue
+                keep.add(largest)
+                remove.update(smaller)
+            if not remove:
+                break
+
+            for group in {group for group, _ in remove}:
+                kept = [i for i in range(len(all_matches[group])) if (group, i) not in remove]
+                all_matches[group] = [all_matches[group][i] for i in kept]
+                all_masks[group] = [all_masks[group][i] for i in kept]
+            covered, duplicated = matched_masks(all_masks)
             iteration += 1
 
-    matched_atoms = set()
-    for i in all_matches.values():
-        for j in i:
-            matched_atoms.update(j)
-    if len(matched_atoms) != atom_count:
+    if covered != (1 << atom_count) - 1:
         status = 'Did not match all atoms present'
         success = False
 
     # Check the atom aount again, this time looking for duplicate matches (only if have yet to fail)
-    if success:
+    if success and duplicated:
         matched_atoms = []
         for i in all_matches.values():
             for j in i:
@@ -473,4 +668,3 @@ def smarts_fragment(catalog, rdkitmol=None, smi=None, deduplicate=True):
             success = False
 
     return counts, success, status
-
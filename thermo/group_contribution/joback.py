@@ -51,7 +51,9 @@ please use the `GitHub issue tracker <https://github.com/CalebBell/thermo/>`_.
 __all__ = ['Joback', 'J_BIGGS_JOBACK_SMARTS',
            'J_BIGGS_JOBACK_SMARTS_id_dict']
 
-from fluids.numerics import exp, horner
+from collections import OrderedDict
+
+from fluids.numerics import exp
 
 from thermo.group_contribution.group_contribution_base import smarts_fragment
 
@@ -59,8 +61,9 @@ rdkit_missing = 'RDKit is not installed; it is required to use this functionalit
 
 loaded_rdkit = False
 Chem, Descriptors, AllChem, rdMolDescriptors = None, None, None, None
+J_BIGGS_JOBACK_SMARTS_id_dict_rdkit = None
 def load_rdkit_modules():
-    global loaded_rdkit, Chem, Descriptors, AllChem, rdMolDescriptors
+    global loaded_rdkit, Chem, Descriptors, AllChem, rdMolDescriptors, J_BIGGS_JOBACK_SMARTS_id_dict_rdkit
     if loaded_rdkit:
         return
     try:
@@ -70,6 +73,8 @@ def load_rdkit_modules():
     except:
         if not loaded_rdkit: # pragma: no cover
             raise Exception(rdkit_missing)
+    # The SMARTS patterns never change; parse them once per process
+    J_BIGGS_JOBACK_SMARTS_id_dict_rdkit = {k: Chem.MolFromSmarts(v) for k, v in J_BIGGS_JOBACK_SMARTS_id_dict.items()}
 
 # See https://www.atmos-chem-phys.net/16/4401/2016/acp-16-4401-2016.pdf for more
 # smarts patterns
@@ -293,6 +298,89 @@ joback_groups_id_dict = {}
 for j in joback_groups_str_dict.values():
     joback_groups_id_dict[j.i] = j
 
+# The contributions of every group to each property, as lists indexed by the
+# group id (position 0 is unused); summing a property then only needs a list
+# index per group rather than a dict lookup and an attribute access
+joback_contributions = {}
+for prop in JOBACK.__slots__[2:]:
+    values = [None]*(len(joback_groups_id_dict) + 1)
+    for j in joback_groups_id_dict.values():
+        values[j.i] = getattr(j, prop)
+    joback_contributions[prop] = values
+
+# The heat capacity and viscosity coefficients of each group together, so a
+# group's row of coefficients is fetched with a single index
+joback_Cp_contributions = list(zip(joback_contributions['Cpa'], joback_contributions['Cpb'],
+                                   joback_contributions['Cpc'], joback_contributions['Cpd']))
+joback_mu_contributions = list(zip(joback_contributions['mua'], joback_contributions['mub']))
+
+def joback_group_sum(counts, contributions):
+    # The sum of the contributions of the groups in `counts` to a property, or
+    # None if any of them is not a Joback group or has no contribution to it
+    tot = 0.0
+    for group, count in counts.items():
+        if group not in joback_groups_id_dict:
+            return None
+        contribution = contributions[group]
+        if contribution is None:
+            return None
+        tot += contribution*count
+    return tot
+
+def joback_contributions_missing(counts, contributions):
+    # Whether any of the groups in `counts` is not a Joback group, or has no
+    # contribution to the property
+    for group in counts:
+        if group not in joback_groups_id_dict or contributions[group] is None:
+            return True
+    return False
+
+# Most recently used parsed SMILES strings; the rdkit parsing, hydrogen
+# addition, molecular weight and fragmentation are only done once for each
+joback_parse_cache = OrderedDict()
+joback_parse_cache_size = 4096
+
+def joback_parse(smi):
+    # The rdkit molecule, the molecule with hydrogens, the atom count, the
+    # molecular weight, and the fragmentation of a SMILES string
+    try:
+        result = joback_parse_cache[smi]
+    except KeyError:
+        pass
+    else:
+        joback_parse_cache.move_to_end(smi)
+        return result
+    rdkitmol = Chem.MolFromSmiles(smi)
+    rdkitmol_Hs = Chem.AddHs(rdkitmol)
+    atom_count = len(rdkitmol_Hs.GetAtoms())
+    MW = rdMolDescriptors.CalcExactMolWt(rdkitmol_Hs)
+    counts, success, status = smarts_fragment(J_BIGGS_JOBACK_SMARTS_id_dict_rdkit, rdkitmol=rdkitmol, cache=False)
+    result = (rdkitmol, rdkitmol_Hs, atom_count, MW, counts, success, status)
+    joback_parse_cache[smi] = result
+    if len(joback_parse_cache) > joback_parse_cache_size:
+        joback_parse_cache.popitem(last=False)
+    return result
+
+# Most recently used fragmentations and their Cpig and mul coefficients;
+# molecules which fragment identically share them
+joback_coeffs_cache = OrderedDict()
+joback_coeffs_cache_size = 8192
+
+def joback_coeffs_cached(counts):
+    # Copies of the `Cpig_coeffs` and `mul_coeffs` of a fragmentation
+    key = frozenset(counts.items())
+    try:
+        Cpig_coeffs, mul_coeffs = joback_coeffs_cache[key]
+    except KeyError:
+        Cpig_coeffs, mul_coeffs = Joback.Cpig_coeffs(counts), Joback.mul_coeffs(counts)
+        joback_coeffs_cache[key] = (Cpig_coeffs, mul_coeffs)
+        if len(joback_coeffs_cache) > joback_coeffs_cache_size:
+            joback_coeffs_cache.popitem(last=False)
+    else:
+        joback_coeffs_cache.move_to_end(key)
+    return (None if Cpig_coeffs is None else list(Cpig_coeffs),
+            None if mul_coeffs is None else list(mul_coeffs))
+
 
 class Joback:
     r'''Class for performing chemical property estimations with the Joback
@@ -387,21 +475,29 @@ class Joback:
         if not loaded_rdkit:
             load_rdkit_modules()
 
-        if type(mol) == Chem.rdchem.Mol:
-            self.rdkitmol = mol
-        else:
-            self.rdkitmol = Chem.MolFromSmiles(mol)
-        if atom_count is None:
-            self.rdkitmol_Hs = Chem.AddHs(self.rdkitmol)
-            self.atom_count = len(self.rdkitmol_Hs.GetAtoms())
+        if not isinstance(mol, Chem.rdchem.Mol):
+            # Repeated SMILES strings are only parsed and fragmented once;
+            # each instance gets its own copies of the cached molecules
+            (rdkitmol, rdkitmol_Hs, parsed_atom_count, parsed_MW,
+             counts, self.success, self.status) = joback_parse(mol)
+            self.rdkitmol = Chem.Mol(rdkitmol)
+            self.rdkitmol_Hs = Chem.Mol(rdkitmol_Hs)
+            self.atom_count = parsed_atom_count if atom_count is None else atom_count
+            self.MW = parsed_MW if MW is None else MW
+            self.counts = dict(counts)
         else:
-            self.atom_count = atom_count
-        if MW is None:
-            self.MW = rdMolDescriptors.CalcExactMolWt(self.rdkitmol_Hs)
-        else:
-            self.MW = MW
-
-        self.counts, self.success, self.status = smarts_fragment(J_BIGGS_JOBACK_SMARTS_id_dict, rdkitmol=self.rdkitmol)
+            self.rdkitmol = mol
+            if atom_count is None:
+                self.rdkitmol_Hs = Chem.AddHs(self.rdkitmol)
+                self.atom_count = len(self.rdkitmol_Hs.GetAtoms())
+            else:
+                self.atom_count = atom_count
+            if MW is None:
+                self.MW = rdMolDescriptors.CalcExactMolWt(self.rdkitmol_Hs)
+            else:
+                self.MW = MW
+
+            self.counts, self.success, self.status = smarts_fragment(J_BIGGS_JOBACK_SMARTS_id_dict_rdkit, rdkitmol=self.rdkitmol)
 
         if Tb is not None:
             self.Tb_estimated = self.Tb(self.counts)
@@ -416,18 +512,27 @@ class Joback:
         '''
         if not self.counts:
             raise ValueError("Zero matching groups identified")
-        # Pre-generate the coefficients or they will not be returned
-        self.mul(300)
-        self.Cpig(300)
-        estimates = {'Tb': self.Tb(self.counts),
-                     'Tm': self.Tm(self.counts),
-                     'Tc': self.Tc(self.counts, self.Tb_estimated),
-                     'Pc': self.Pc(self.counts, self.atom_count),
-                     'Vc': self.Vc(self.counts),
-                     'Hf': self.Hf(self.counts),
-                     'Gf': self.Gf(self.counts),
-                     'Hfus': self.Hfus(self.counts),
-                     'Hvap': self.Hvap(self.counts),
+        counts = self.counts
+        # Generate the coefficients here or they will not be returned
+        if self.calculated_Cpig_coeffs is None or self.calculated_mul_coeffs is None:
+            Cpig_coeffs, mul_coeffs = joback_coeffs_cached(counts)
+            if self.calculated_Cpig_coeffs is None:
+                self.calculated_Cpig_coeffs = Cpig_coeffs
+            if self.calculated_mul_coeffs is None:
+                self.calculated_mul_coeffs = mul_coeffs
+        # Tc needs a boiling point; reuse the estimated one rather than
+        # summing the Tb contributions a second time
+        Tb = self.Tb(counts)
+        Tb_Tc = Tb if self.Tb_estimated is None else self.Tb_estimated
+        estimates = {'Tb': Tb,
+                     'Tm': self.Tm(counts),
+                     'Tc': self.Tc(counts, Tb_Tc),
+                     'Pc': self.Pc(counts, self.atom_count),
+                     'Vc': self.Vc(counts),
+                     'Hf': self.Hf(counts),
+                     'Gf': self.Gf(counts),
+                     'Hfus': self.Hfus(counts),
+                     'Hvap': self.Hvap(counts),
                      'mul_coeffs': self.calculated_mul_coeffs,
                      'Cpig_coeffs': self.calculated_Cpig_coeffs}
         if callables:
@@ -463,14 +568,11 @@ class Joback:
         >>> Joback.Tb({1: 2, 24: 1})
         322.11
         '''
-        try:
-            tot = 0.0
-            for group, count in counts.items():
-                tot += joback_groups_id_dict[group].Tb*count
-            Tb = 198.2 + tot
-            return Tb
-        except:
+        tot = joback_group_sum(counts, joback_contributions['Tb'])
+        if tot is None:
             return None
+        Tb = 198.2 + tot
+        return Tb
 
     @staticmethod
     def Tm(counts):
@@ -500,14 +602,11 @@ class Joback:
         >>> Joback.Tm({1: 2, 24: 1})
         173.5
         '''
-        try:
-            tot = 0.0
-            for group, count in counts.items():
-                tot += joback_groups_id_dict[group].Tm*count
-            Tm = 122.5 + tot
-            return Tm
-        except:
+        tot = joback_group_sum(counts, joback_contributions['Tm'])
+        if tot is None:
             return None
+        Tm = 122.5 + tot
+        return Tm
 
     @staticmethod
     def Tc(counts, Tb=None):
@@ -537,24 +636,29 @@ class Joback:
 
         Returns
         -------
-        Tc : float
-            Estimated critical temperature, [K]
+        Tc : float or None
+            Estimated critical temperature; None if a group has no
+            contribution or the groups are outside the range of the
+            correlation (a non-positive denominator), [K]
 
         Examples
         --------
         >>> Joback.Tc({1: 2, 24: 1}, Tb=322.11)
         500.5590049525365
         '''
-        try:
+        if Tb is None:
+            Tb = Joback.Tb(counts)
             if Tb is None:
-                Tb = Joback.Tb(counts)
-            tot = 0.0
-            for group, count in counts.items():
-                tot += joback_groups_id_dict[group].Tc*count
-            Tc = Tb/(0.584 + 0.965*tot - tot*tot)
-            return Tc
-        except:
+                return None
+        tot = joback_group_sum(counts, joback_contributions['Tc'])
+        if tot is None:
             return None
+        den = 0.584 + 0.965*tot - tot*tot
+        if den <= 0.0:
+            # Outside the range of the correlation; can't make a prediction
+            return None
+        Tc = Tb/den
+        return Tc
 
     @staticmethod
     def Pc(counts, atom_count):
@@ -583,22 +687,23 @@ class Joback:
 
         Returns
         -------
-        Pc : float
-            Estimated critical pressure, [Pa]
+        Pc : float or None
+            Estimated critical pressure; None if a group has no contribution
+            or the bracketed term is zero, [Pa]
 
         Examples
         --------
         >>> Joback.Pc({1: 2, 24: 1}, 10)
         4802499.604994407
         '''
-        try:
-            tot = 0.0
-            for group, count in counts.items():
-                tot += joback_groups_id_dict[group].Pc*count
-            Pc = (0.113 + 0.0032*atom_count - tot)**-2
-            return Pc*1E5 # bar to Pa
-        except:
+        tot = joback_group_sum(counts, joback_contributions['Pc'])
+        if tot is None:
             return None
+        base = 0.113 + 0.0032*atom_count - tot
+        if base == 0.0:
+            return None
+        Pc = base**-2
+        return Pc*1E5 # bar to Pa
 
     @staticmethod
     def Vc(counts):
@@ -631,14 +736,11 @@ class Joback:
         >>> Joback.Vc({1: 2, 24: 1})
         0.0002095
         '''
-        try:
-            tot = 0.0
-            for group, count in counts.items():
-                tot += joback_groups_id_dict[group].Vc*count
-            Vc = 17.5 + tot
-            return Vc*1E-6 # cm^3/mol to m^3/mol
-        except:
+        tot = joback_group_sum(counts, joback_contributions['Vc'])
+        if tot is None:
             return None
+        Vc = 17.5 + tot
+        return Vc*1E-6 # cm^3/mol to m^3/mol
 
     @staticmethod
     def Hf(counts):
@@ -672,14 +774,11 @@ class Joback:
         >>> Joback.Hf({1: 2, 24: 1})
         -217829.99999999997
         '''
-        try:
-            tot = 0.0
-            for group, count in counts.items():
-                tot += joback_groups_id_dict[group].Hform*count
-            Hf = 68.29 + tot
-            return Hf*1000 # kJ/mol to J/mol
-        except:
+        tot = joback_group_sum(counts, joback_contributions['Hform'])
+        if tot is None:
             return None
+        Hf = 68.29 + tot
+        return Hf*1000 # kJ/mol to J/mol
 
     @staticmethod
     def Gf(counts):
@@ -713,14 +812,11 @@ class Joback:
         >>> Joback.Gf({1: 2, 24: 1})
         -154540.00000000003
         '''
-        try:
-            tot = 0.0
-            for group, count in counts.items():
-                tot += joback_groups_id_dict[group].Gform*count
-            Gf = 53.88 + tot
-            return Gf*1000 # kJ/mol to J/mol
-        except:
+        tot = joback_group_sum(counts, joback_contributions['Gform'])
+        if tot is None:
             return None
+        Gf = 53.88 + tot
+        return Gf*1000 # kJ/mol to J/mol
 
     @staticmethod
     def Hfus(counts):
@@ -755,14 +851,11 @@ class Joback:
         >>> Joback.Hfus({1: 2, 24: 1})
         5125.0
         '''
-        try:
-            tot = 0.0
-            for group, count in counts.items():
-                tot += joback_groups_id_dict[group].Hfus*count
-            Hfus = -0.88 + tot
-            return Hfus*1000 # kJ/mol to J/mol
-        except:
+        tot = joback_group_sum(counts, joback_contributions['Hfus'])
+        if tot is None:
             return None
+        Hfus = -0.88 + tot
+        return Hfus*1000 # kJ/mol to J/mol
 
     @staticmethod
     def Hvap(counts):
@@ -797,14 +890,11 @@ class Joback:
         >>> Joback.Hvap({1: 2, 24: 1})
         29018.0
         '''
-        try:
-            tot = 0.0
-            for group, count in counts.items():
-                tot += joback_groups_id_dict[group].Hvap*count
-            Hvap = 15.3 + tot
-            return Hvap*1000 # kJ/mol to J/mol
-        except:
+        tot = joback_group_sum(counts, joback_contributions['Hvap'])
+        if tot is None:
             return None
+        Hvap = 15.3 + tot
+        return Hvap*1000 # kJ/mol to J/mol
 
     @staticmethod
     def Cpig_coeffs(counts):
@@ -844,20 +934,21 @@ class Joback:
         >>> Cp(300)
         75.32642000000001
         '''
-        try:
-            a, b, c, d = 0.0, 0.0, 0.0, 0.0
-            for group, count in counts.items():
-                a += joback_groups_id_dict[group].Cpa*count
-                b += joback_groups_id_dict[group].Cpb*count
-                c += joback_groups_id_dict[group].Cpc*count
-                d += joback_groups_id_dict[group].Cpd*count
-            a -= 37.93
-            b += 0.210
-            c -= 3.91E-4
-            d += 2.06E-7
-            return [a, b, c, d]
-        except:
+        # The four coefficients are missing for the same groups
+        if joback_contributions_missing(counts, joback_contributions['Cpa']):
             return None
+        a, b, c, d = 0.0, 0.0, 0.0, 0.0
+        for group, count in counts.items():
+            Cpa, Cpb, Cpc, Cpd = joback_Cp_contributions[group]
+            a += Cpa*count
+            b += Cpb*count
+            c += Cpc*count
+            d += Cpd*count
+        a -= 37.93
+        b += 0.210
+        c -= 3.91E-4
+        d += 2.06E-7
+        return [a, b, c, d]
 
     @staticmethod
     def mul_coeffs(counts):
@@ -898,16 +989,17 @@ class Joback:
         >>> mul(300)
         0.0002940378347162687
         '''
-        try:
-            a, b = 0.0, 0.0
-            for group, count in counts.items():
-                a += joback_groups_id_dict[group].mua*count
-                b += joback_groups_id_dict[group].mub*count
-            a -= 597.82
-            b -= 11.202
-            return [a, b]
-        except:
+        # Both coefficients are missing for the same groups
+        if joback_contributions_missing(counts, joback_contributions['mua']):
             return None
+        a, b = 0.0, 0.0
+        for group, count in counts.items():
+            mua, mub = joback_mu_contributions[group]
+            a += mua*count
+            b += mub*count
+        a -= 597.82
+        b -= 11.202
+        return [a, b]
 
     def Cpig(self, T):
         r'''Computes ideal-gas heat capacity at a specified temperature
@@ -937,9 +1029,9 @@ class Joback:
         '''
         try:
             if self.calculated_Cpig_coeffs is None:
-                self.calculated_Cpig_coeffs = Joback.Cpig_coeffs(self.counts)
-            coeffs = list(reversed(self.calculated_Cpig_coeffs))
-            return horner(coeffs, T)
+                self.calculated_Cpig_coeffs = joback_coeffs_cached(self.counts)[0]
+            a, b, c, d = self.calculated_Cpig_coeffs
+            return a + T*(b + T*(c + T*d))
         except:
             return None
 
@@ -970,7 +1062,7 @@ class Joback:
         '''
         try:
             if self.calculated_mul_coeffs is None:
-                self.calculated_mul_coeffs = Joback.mul_coeffs(self.counts)
+                self.calculated_mul_coeffs = joback_coeffs_cached(self.counts)[1]
             a, b = self.calculated_mul_coeffs
             return self.MW*exp(a/T + b)
         except:
@@ -31,6 +31,7 @@ This functionality requires the RDKit library to work.
 __all__ = ['Wilson_Jasperson', 'Wilson_Jasperson_Tc_increments',
            'Wilson_Jasperson_Pc_increments',
            'Wilson_Jasperson_Tc_groups', 'Wilson_Jasperson_Pc_groups']
+from collections import OrderedDict
 from math import exp
 
 from chemicals.elements import simple_formula_parser
@@ -43,7 +44,7 @@ from thermo.functional_groups import (
     disulfide_smarts,
     ester_smarts,
     ether_smarts,
-    is_haloalkane,
+    haloalkane_smarts,
     ketone_smarts,
     mercaptan_smarts,
     nitrile_smarts,
@@ -53,6 +54,54 @@ from thermo.functional_groups import (
     sulfide_smarts,
 )
 
+rdkit_missing = 'RDKit is not installed; it is required to use this functionality'
+
+loaded_rdkit = False
+Chem = rdMolDescriptors = None
+alcohol_patt = ether_patt = nitro_patt = nitrile_patt = amine_patt = None
+aldehyde_patt = ketone_patt = carboxylic_acid_patt = ester_patt = haloalkane_patt = sulfur_patts = siloxane_patt = None
+def atom_union_smarts_mol(smarts_list, atomic_number):
+    # One recursive SMARTS query matching the atom of `atomic_number` in any
+    # of the patterns, so a molecule is searched once for all of them. A
+    # recursive SMARTS matches on its first atom, so each pattern is
+    # rewritten to start from that atom; query atoms such as [NX3,NX4] have
+    # no single atomic number, but in these patterns they always come first
+    roots = []
+    for smarts in smarts_list:
+        patt = smarts_mol_cache(smarts)
+        idx = next((atom.GetIdx() for atom in patt.GetAtoms() if atom.GetAtomicNum() == atomic_number), 0)
+        roots.append(Chem.MolToSmarts(patt, rootedAtAtom=idx))
+    return Chem.MolFromSmarts('[$(' + '),$('.join(roots) + ')]')
+
+def load_rdkit_modules():
+    global loaded_rdkit, Chem, rdMolDescriptors, alcohol_patt, ether_patt, nitro_patt, nitrile_patt, amine_patt
+    global aldehyde_patt, ketone_patt, carboxylic_acid_patt, ester_patt, haloalkane_patt, sulfur_patts, siloxane_patt
+    if loaded_rdkit:
+        return
+    try:
+        from rdkit import Chem
+        from rdkit.Chem import rdMolDescriptors
+        loaded_rdkit = True
+    except:
+        raise Exception(rdkit_missing) # pragma: no cover
+    # The patterns never change; look them up once per process
+    alcohol_patt = smarts_mol_cache(alcohol_smarts)
+    ether_patt = smarts_mol_cache(ether_smarts)
+    nitro_patt = smarts_mol_cache(nitro_smarts)
+    nitrile_patt = smarts_mol_cache(nitrile_smarts)
+    amine_patt = atom_union_smarts_mol(all_amine_smarts, 7)
+    aldehyde_patt = smarts_mol_cache(aldehyde_smarts)
+    ketone_patt = smarts_mol_cache(ketone_smarts)
+    carboxylic_acid_patt = smarts_mol_cache(carboxylic_acid_smarts)
+    ester_patt = smarts_mol_cache(ester_smarts)
+    haloalkane_patt = smarts_mol_cache(haloalkane_smarts)
+    # Mercaptans and sulfides each have one match per S atom, and never the
+    # same one (H vs. H0), so they are found together; disulfides have one
+    # match per S-S bond
+    sulfur_patts = [atom_union_smarts_mol((mercaptan_smarts, sulfide_smarts), 16),
+                    smarts_mol_cache(disulfide_smarts)]
+    siloxane_patt = smarts_mol_cache(siloxane_smarts)
+
 Wilson_Jasperson_Tc_increments = {
 'H': 0.002793,
 'D': 0.002793,
@@ -154,6 +203,114 @@ Wilson_Jasperson_Pc_groups = {'OH_large': 0, 'OH_small': 0, '-O-': 0, 'amine': 0
                              '-CN': 1.5, '-NO2': 1.0, 'halide': 0, 'sulfur_groups': 0.0,
                             'siloxane': -0.5}
 
+halogen_atoms = frozenset(['F', 'Cl', 'Br', 'I'])
+
+# The Tc and Pc increments of each element and second order contributions of
+# each group together, so both are found with one lookup
+Wilson_Jasperson_increments = {k: (Wilson_Jasperson_Tc_increments[k], Wilson_Jasperson_Pc_increments[k])
+                               for k in Wilson_Jasperson_Tc_increments}
+Wilson_Jasperson_groups = {k: (Wilson_Jasperson_Tc_groups[k], Wilson_Jasperson_Pc_groups[k])
+                           for k in Wilson_Jasperson_Tc_groups}
+
+# Most recently used SMILES strings and the groups found in them; these do
+# not depend on `Tb`, so repeated estimates of a molecule reuse them
+wilson_jasperson_parse_cache = OrderedDict()
+wilson_jasperson_parse_cache_size = 4096
+
+def wilson_jasperson_parse(smi):
+    # The ring count, atom counts, and second order group counts of a SMILES
+    # string; these are shared and must not be modified
+    try:
+        result = wilson_jasperson_parse_cache[smi]
+    except KeyError:
+        pass
+    else:
+        wilson_jasperson_parse_cache.move_to_end(smi)
+        return result
+    result = wilson_jasperson_fragment(Chem.MolFromSmiles(smi))
+    wilson_jasperson_parse_cache[smi] = result
+    if len(wilson_jasperson_parse_cache) > wilson_jasperson_parse_cache_size:
+        wilson_jasperson_parse_cache.popitem(last=False)
+    return result
+
+def wilson_jasperson_fragment(rdkitmol, second_order=True):
+    # The ring count, atom counts, and second order group counts of a
+    # molecule; the group counts are None if `second_order` is False. The
+    # molecule is only searched, never modified, so it is not copied
+    ri = rdkitmol.GetRingInfo()
+    atom_rings = ri.AtomRings()
+    Nr = len(atom_rings)
+
+    atoms = simple_formula_parser(rdMolDescriptors.CalcMolFormula(rdkitmol))
+    if not second_order:
+        # The first order method needs no substructure searches
+        return Nr, atoms, None
+    # Every unique match of these patterns has its own atom or bond, so this
+    # is never reached; rdkit would otherwise stop counting at 1000 matches
+    max_matches = rdkitmol.GetNumAtoms() + rdkitmol.GetNumBonds()
+
+    # The element counts show which groups cannot be present; those
+    # substructure searches are skipped
+    has_CO = 'C' in atoms and 'O' in atoms
+    group_contributions = {}
+    if 'C' in atoms:
+        OH_count = len(rdkitmol.GetSubstructMatches(alcohol_patt, maxMatches=max_matches)) if has_CO else 0
+        if atoms['C'] >= 5:
+            group_contributions['OH_large'] = OH_count
+        else:
+            group_contributions['OH_small'] = OH_count
+
+    ether_O_matches =  rdkitmol.GetSubstructMatches(ether_patt, maxMatches=max_matches) if has_CO else ()
+    group_contributions['-O-'] = len(ether_O_matches)
+
+
+    group_contributions['-CN'] = 0
+    amine_count = 0
+    if 'N' in atoms:
+        nitro_matches =  rdkitmol.GetSubstructMatches(nitro_patt, maxMatches=max_matches)
+        group_contributions['-NO2'] = len(nitro_matches)
+
+        nitrile_matches =  rdkitmol.GetSubstructMatches(nitrile_patt, maxMatches=max_matches)
+        group_contributions['-CN'] = len(nitrile_matches)
+
+        # Each match is a different amine N atom
+        amine_count = len(rdkitmol.GetSubstructMatches(amine_patt, maxMatches=max_matches))
+    group_contributions['amine'] = amine_count
+
+    if has_CO:
+        aldehyde_matches =  rdkitmol.GetSubstructMatches(aldehyde_patt, maxMatches=max_matches)
+        group_contributions['-CHO'] = len(aldehyde_matches)
+
+        ketone_matches =  rdkitmol.GetSubstructMatches(ketone_patt, maxMatches=max_matches)
+        group_contributions['>CO'] = len(ketone_matches)
+
+        carboxylic_acid_matches =  rdkitmol.GetSubstructMatches(carboxylic_acid_patt, maxMatches=max_matches)
+        group_contributions['-COOH'] = len(carboxylic_acid_matches)
+
+        ester_matches =  rdkitmol.GetSubstructMatches(ester_patt, maxMatches=max_matches)
+        group_contributions['-COO-'] = len(ester_matches)
+
+
+
+    group_contributions['halide'] = 0
+    if 'C' in atoms and not halogen_atoms.isdisjoint(atoms):
+        group_contributions['halide'] = 1 if rdkitmol.HasSubstructMatch(haloalkane_patt) else 0
+
+    group_contributions['sulfur_groups'] = 0
+    if 'S' in atoms:
+        for sulfur_patt in sulfur_patts:
+            group_contributions['sulfur_groups'] += len(rdkitmol.GetSubstructMatches(sulfur_patt, maxMatches=max_matches))
+
+    group_contributions['siloxane'] = 0
+    if 'Si' in atoms:
+        siloxane_matches = rdkitmol.GetSubstructMatches(siloxane_patt, maxMatches=max_matches)
+        group_contributions['siloxane'] = len(siloxane_matches)
+
+#     group_contributions = {'OH_large': 0, '-O-': 0, 'amine': 0, '-CHO': 0,
+#                            '>CO': 0, '-COOH': 0, '-COO-': 0, '-CN': 0,
+#                            '-NO2': 0, 'halide': 0, 'sulfur_groups': 0, 'siloxane': 0}
+    return Nr, atoms, group_contributions
+
 def Wilson_Jasperson(mol, Tb, second_order=True):
     r'''Estimate the critical temperature and pressure of a molecule using
     the molecule itself, and a known or estimated boiling point
@@ -212,107 +369,36 @@ def Wilson_Jasperson(mol, Tb, second_order=True):
        Organic Compounds." Journal of Chemical & Engineering Data 48, no. 2
        (March 1, 2003): 374-80. https://doi.org/10.1021/je025596f.
     '''
-    from rdkit import Chem
-    from rdkit.Chem import rdMolDescriptors
-    if type(mol) is Chem.rdchem.Mol:
-        rdkitmol = Chem.Mol(mol)
-        no_H_mol = mol
+    if not loaded_rdkit:
+        load_rdkit_modules()
+    if isinstance(mol, Chem.rdchem.Mol):
+        Nr, atoms, group_contributions = wilson_jasperson_fragment(mol, second_order)
     else:
-        rdkitmol = Chem.MolFromSmiles(mol)
-        no_H_mol = Chem.Mol(rdkitmol)
-
-    ri = no_H_mol.GetRingInfo()
-    atom_rings = ri.AtomRings()
-    Nr = len(atom_rings)
-
-    atoms = simple_formula_parser(rdMolDescriptors.CalcMolFormula(rdkitmol))
-
-    group_contributions = {}
-    OH_matches = rdkitmol.GetSubstructMatches(smarts_mol_cache(alcohol_smarts))
-    if 'C' in atoms:
-        if atoms['C'] >= 5:
-            group_contributions['OH_large'] = len(OH_matches)
-        else:
-            group_contributions['OH_small'] = len(OH_matches)
-
-    ether_O_matches =  rdkitmol.GetSubstructMatches(smarts_mol_cache(ether_smarts))
-    group_contributions['-O-'] = len(ether_O_matches)
-
-
-    group_contributions['-CN'] = 0
-    amine_groups = set()
-    if 'N' in atoms:
-        nitro_matches =  rdkitmol.GetSubstructMatches(smarts_mol_cache(nitro_smarts))
-        group_contributions['-NO2'] = len(nitro_matches)
-
-        nitrile_matches =  rdkitmol.GetSubstructMatches(smarts_mol_cache(nitrile_smarts))
-        group_contributions['-CN'] = len(nitrile_matches)
-
-        for s in all_amine_smarts:
-            amine_matches =  rdkitmol.GetSubstructMatches(smarts_mol_cache(s))
-            for h in amine_matches:
-                # Get the N atom and store its index
-                for at in h:
-                    atom = rdkitmol.GetAtomWithIdx(at)
-                    if atom.GetSymbol() == 'N':
-                        amine_groups.add(at)
-#     print(amine_groups)
-    group_contributions['amine'] = len(amine_groups)
-
-    if 'O' in atoms and 'C' in atoms:
-        aldehyde_matches =  rdkitmol.GetSubstructMatches(smarts_mol_cache(aldehyde_smarts))
-        group_contributions['-CHO'] = len(aldehyde_matches)
-
-        ketone_matches =  rdkitmol.GetSubstructMatches(smarts_mol_cache(ketone_smarts))
-        group_contributions['>CO'] = len(ketone_matches)
+        # Repeated SMILES strings are only parsed and searched once
+        Nr, atoms, group_contributions = wilson_jasperson_parse(mol)
 
-        carboxylic_acid_matches =  rdkitmol.GetSubstructMatches(smarts_mol_cache(carboxylic_acid_smarts))
-        group_contributions['-COOH'] = len(carboxylic_acid_matches)
-
-        ester_matches =  rdkitmol.GetSubstructMatches(smarts_mol_cache(ester_smarts))
-        group_contributions['-COO-'] = len(ester_matches)
-
-
-
-    group_contributions['halide'] = 1 if is_haloalkane(rdkitmol) else 0
-
-    group_contributions['sulfur_groups'] = 0
-    if 'S' in atoms:
-        for s in (mercaptan_smarts, sulfide_smarts, disulfide_smarts):
-            group_contributions['sulfur_groups'] += len(rdkitmol.GetSubstructMatches(smarts_mol_cache(s)))
-
-    group_contributions['siloxane'] = 0
-    if 'Si' in atoms:
-        siloxane_matches = rdkitmol.GetSubstructMatches(smarts_mol_cache(siloxane_smarts))
-        group_contributions['siloxane'] = len(siloxane_matches)
-
-#     group_contributions = {'OH_large': 0, '-O-': 0, 'amine': 0, '-CHO': 0,
-#                            '>CO': 0, '-COOH': 0, '-COO-': 0, '-CN': 0,
-#                            '-NO2': 0, 'halide': 0, 'sulfur_groups': 0, 'siloxane': 0}
-
-    missing_Tc_increments = False
-    Tc_inc = 0.0
-    for k, v in atoms.items():
-        try:
-            Tc_inc += Wilson_Jasperson_Tc_increments[k]*v
-        except KeyError:
-            missing_Tc_increments = True
-
-    missing_Pc_increments = False
-    Pc_inc = 0.0
+    # Pc increments are None for elements without a regressed value
+    missing_Tc_increments = missing_Pc_increments = False
+    Tc_inc = Pc_inc = 0.0
     for k, v in atoms.items():
-        try:
-            Pc_inc += Wilson_Jasperson_Pc_increments[k]*v
-        except (KeyError, TypeError):
+        increments = Wilson_Jasperson_increments.get(k)
+        if increments is None:
+            missing_Tc_increments = missing_Pc_increments = True
+            continue
+        Tc_atom, Pc_atom = increments
+        Tc_inc += Tc_atom*v
+        if Pc_atom is None:
             missing_Pc_increments = True
+        else:
+            Pc_inc += Pc_atom*v
 
     second_order_Pc = 0.0
     second_order_Tc = 0.0
     if second_order:
         for k, v in group_contributions.items():
-            second_order_Tc += Wilson_Jasperson_Tc_groups[k]*v
-        for k, v in group_contributions.items():
-            second_order_Pc += Wilson_Jasperson_Pc_groups[k]*v
+            Tc_group, Pc_group = Wilson_Jasperson_groups[k]
+            second_order_Tc += Tc_group*v
+            second_order_Pc += Pc_group*v
 
 #     print(atoms)
 #     print(group_contributions)
@@ -2738,7 +2738,7 @@ class TDependentProperty:
         elif method == POLY_FIT:
             return horner(self.poly_fit_coeffs, T)
         elif method == EXP_POLY_FIT:
-            return exp_horner_backwards(T, self.exp_poly_fit_coeffs)
+            return exp(horner(self.exp_poly_fit_coeffs, T))
         elif method == POLY_FIT_LN_TAU:
             return horner_backwards_ln_tau(T, self.poly_fit_ln_tau_Tc, self.poly_fit_ln_tau_coeffs)
         elif method == EXP_POLY_FIT_LN_TAU:
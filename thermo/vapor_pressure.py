@@ -32,7 +32,7 @@ please use the `GitHub issue tracker <https://github.com/CalebBell/thermo/>`_.
 Vapor Pressure
 ==============
 .. autoclass:: VaporPressure
-    :members: calculate, test_method_validity,
+    :members: calculate, calculate_vectorized, test_method_validity,
               interpolation_T, interpolation_property,
               interpolation_property_inv, name, property_max, property_min,
               units, ranked_methods
@@ -88,6 +88,7 @@ from chemicals.vapor_pressure import (
     dWagner_original_dT,
 )
 from fluids.numerics import NoSolutionError, exp, isnan, log
+from fluids.numerics import numpy as np
 
 from thermo.coolprop import PropsSI, coolprop_dict, coolprop_fluids, has_CoolProp
 from thermo.utils import COOLPROP, DIPPR_PERRY_8E, EOS, HEOS_FIT, IAPWS, VDI_PPDS, VDI_TABULAR, TDependentProperty
@@ -141,6 +142,16 @@ Psat_extra_correlations['7440-41-7'] = [
 End specific correlations
 """
 
+_webbook_Antoine_values = None
+
+def webbook_Antoine_values():
+    # The WebBook columns are sparse; reading them once as a dense array is
+    # much faster than several DataFrame.at lookups per chemical
+    global _webbook_Antoine_values
+    if _webbook_Antoine_values is None:
+        _webbook_Antoine_values = miscdata.webbook_data[['AntoineA', 'AntoineB', 'AntoineC', 'AntoineTmin', 'AntoineTmax']].to_numpy(dtype=float)
+    return _webbook_Antoine_values
+
 
 
 
@@ -399,12 +410,12 @@ class VaporPressure(TDependentProperty):
                 methods.append(IAPWS)
                 T_limits[IAPWS] = (235.0, iapws95_Tc)
 
-            if CASRN_int in df_wb.index and not isnan(float(df_wb.at[CASRN_int, 'AntoineA'])):
-                methods.append(ANTOINE_WEBBOOK)
-                self.ANTOINE_WEBBOOK_coefs = [float(df_wb.at[CASRN_int, 'AntoineA']),
-                                              float(df_wb.at[CASRN_int, 'AntoineB']),
-                                              float(df_wb.at[CASRN_int, 'AntoineC'])]
-                T_limits[ANTOINE_WEBBOOK] = (float(df_wb.at[CASRN_int, 'AntoineTmin']),float(df_wb.at[CASRN_int, 'AntoineTmax']))
+            if CASRN_int in df_wb.index:
+                A, B, C, Tmin, Tmax = webbook_Antoine_values()[df_wb.index.get_loc(CASRN_int)].tolist()
+                if not isnan(A):
+                    methods.append(ANTOINE_WEBBOOK)
+                    self.ANTOINE_WEBBOOK_coefs = [A, B, C]
+                    T_limits[ANTOINE_WEBBOOK] = (Tmin, Tmax)
             if CASRN in vapor_pressure.Psat_data_WagnerMcGarry.index:
                 methods.append(WAGNER_MCGARRY)
                 A, B, C, D, self.WAGNER_MCGARRY_Pc, self.WAGNER_MCGARRY_Tc, self.WAGNER_MCGARRY_Tmin = vapor_pressure.Psat_values_WagnerMcGarry[vapor_pressure.Psat_data_WagnerMcGarry.index.get_loc(CASRN)].tolist()
@@ -498,26 +509,28 @@ class VaporPressure(TDependentProperty):
         Psat : float
             Vapor pressure at T, [Pa]
         '''
-        if method == WAGNER_MCGARRY:
-            Psat = Wagner_original(T, self.WAGNER_MCGARRY_Tc, self.WAGNER_MCGARRY_Pc, *self.WAGNER_MCGARRY_coefs)
-        elif method == WAGNER_POLING:
-            Psat = Wagner(T, self.WAGNER_POLING_Tc, self.WAGNER_POLING_Pc, *self.WAGNER_POLING_coefs)
-        elif method == ANTOINE_EXTENDED_POLING:
-            Psat = TRC_Antoine_extended(T, *self.ANTOINE_EXTENDED_POLING_coefs)
-        elif method == ANTOINE_POLING:
-            A, B, C = self.ANTOINE_POLING_coefs
-            Psat = Antoine(T, A, B, C, base=10.0)
+        # Ordered by how often each method is the default one, most first
+        if method == LANDOLT:
+            A, B, C = self.LANDOLT_coefs
+            Psat = Antoine(T, A, B, C, base=e)
         elif method == ANTOINE_WEBBOOK:
             A, B, C = self.ANTOINE_WEBBOOK_coefs
             Psat = Antoine(T, A, B, C, base=e)
-        elif method == LANDOLT:
-            return Antoine(T, *self.LANDOLT_coefs, base=e)
+        elif method == WAGNER_MCGARRY:
+            Psat = Wagner_original(T, self.WAGNER_MCGARRY_Tc, self.WAGNER_MCGARRY_Pc, *self.WAGNER_MCGARRY_coefs)
         elif method == DIPPR_PERRY_8E:
             Psat = EQ101(T, *self.Perrys2_8_coeffs)
-        elif method == ALCOCK_ELEMENTS:
-            Psat = EQ101(T, *self.Alcock_coeffs)
+        elif method == ANTOINE_POLING:
+            A, B, C = self.ANTOINE_POLING_coefs
+            Psat = Antoine(T, A, B, C, base=10.0)
         elif method == VDI_PPDS:
             Psat = Wagner(T, self.VDI_PPDS_Tc, self.VDI_PPDS_Pc, *self.VDI_PPDS_coeffs)
+        elif method == WAGNER_POLING:
+            Psat = Wagner(T, self.WAGNER_POLING_Tc, self.WAGNER_POLING_Pc, *self.WAGNER_POLING_coefs)
+        elif method == ALCOCK_ELEMENTS:
+            Psat = EQ101(T, *self.Alcock_coeffs)
+        elif method == ANTOINE_EXTENDED_POLING:
+            Psat = TRC_Antoine_extended(T, *self.ANTOINE_EXTENDED_POLING_coefs)
         elif method == COOLPROP:
             Psat = PropsSI('P','T', T,'Q',0, self.CASRN)
         elif method == BOILING_CRITICAL:
@@ -538,11 +551,79 @@ class VaporPressure(TDependentProperty):
             except NoSolutionError as err:
                 if 'is too low for equations' in err.args[0]:
                     return 0.0
-                raise e
+                raise
         else:
             return self._base_calculate(T, method)
         return Psat
 
+    def calculate_vectorized(self, Ts, method):
+        r'''Method to calculate vapor pressure of a fluid at many temperatures
+        with a given method. The method is dispatched once, and the Antoine,
+        Wagner and DIPPR 101 type methods are evaluated with NumPy over the
+        whole array; all other methods call :obj:`calculate` for each
+        temperature.
+
+        This method has no exception handling or validity checking, like
+        :obj:`calculate`.
+
+        Parameters
+        ----------
+        Ts : array-like
+            Temperatures at which to calculate vapor pressure; a scalar is
+            treated as a single temperature, [K]
+        method : str
+            Name of the method to use
+
+        Returns
+        -------
+        Psats : ndarray
+            Vapor pressures at `Ts`, as a 1-D array, [Pa]
+        '''
+        Ts = np.atleast_1d(np.asarray(Ts, dtype=float))
+        if method in (ANTOINE_POLING, ANTOINE_WEBBOOK, LANDOLT):
+            if method == ANTOINE_POLING:
+                (A, B, C), base = self.ANTOINE_POLING_coefs, 10.0
+            elif method == ANTOINE_WEBBOOK:
+                (A, B, C), base = self.ANTOINE_WEBBOOK_coefs, e
+            else:
+                (A, B, C), base = self.LANDOLT_coefs, e
+            T_C = Ts + C
+            Psats = np.zeros_like(T_C)
+            valid = T_C > 0.0
+            Psats[valid] = np.power(base, A - B/T_C[valid])
+            return Psats
+        elif method in (WAGNER_POLING, VDI_PPDS):
+            if method == WAGNER_POLING:
+                Tc, Pc, (a, b, c, d) = self.WAGNER_POLING_Tc, self.WAGNER_POLING_Pc, self.WAGNER_POLING_coefs
+            else:
+                Tc, Pc, (a, b, c, d) = self.VDI_PPDS_Tc, self.VDI_PPDS_Pc, self.VDI_PPDS_coeffs
+            Tr = np.minimum(Ts/Tc, 1.0)
+            tau = 1.0 - Tr
+            tau_rt = np.sqrt(tau)
+            tau15 = tau*tau_rt
+            tau25 = tau*tau15
+            return Pc*np.exp((a + b*tau_rt + tau15*(c + d*tau25))*tau/Tr)
+        elif method == WAGNER_MCGARRY:
+            Tc, Pc = self.WAGNER_MCGARRY_Tc, self.WAGNER_MCGARRY_Pc
+            a, b, c, d = self.WAGNER_MCGARRY_coefs
+            Tr = np.minimum(Ts/Tc, 1.0)
+            tau = 1.0 - Tr
+            tau2 = tau*tau
+            Psats = np.zeros_like(Tr)
+            valid = Tr != 0.0
+            tau, tau2 = tau[valid], tau2[valid]
+            Psats[valid] = Pc*np.exp(((d*tau2*tau + c)*tau2 + a + b*np.sqrt(tau))*tau/Tr[valid])
+            return Psats
+        elif method in (DIPPR_PERRY_8E, ALCOCK_ELEMENTS):
+            A, B, C, D, E = self.Perrys2_8_coeffs if method == DIPPR_PERRY_8E else self.Alcock_coeffs
+            with np.errstate(over='ignore', divide='ignore'):
+                T_E = np.power(Ts, E)
+                # Only powers which overflow are replaced, as in EQ101
+                T_E[np.isinf(T_E)] = 1e250
+                # Same truncation as trunc_exp
+                return np.minimum(np.exp(A + B/Ts + C*np.log(Ts) + D*T_E), 1.7976931348622732e+308)
+        return np.array([self.calculate(T, method) for T in Ts.tolist()])
+
     def test_method_validity(self, T, method):
         r'''Method to check the validity of a method. Follows the given
         ranges for all coefficient-based methods. For CSP methods, the models
@@ -813,7 +894,7 @@ class SublimationPressure(TDependentProperty):
             Sublimation pressure at T, [Pa]
         '''
         if method == PSUB_CLAPEYRON:
-            Psub = max(Psub_Clapeyron(T, Tt=self.Tt, Pt=self.Pt, Hsub_t=self.Hsub_t), 1e-200)
+            Psub = max(Psub_Clapeyron(T, self.Tt, self.Pt, self.Hsub_t), 1e-200)
         elif method == IAPWS:
             Psub = iapws11_Psub(T)
         elif method == ALCOCK_ELEMENTS: